@@ -18,7 +18,7 @@ from tiresias.core.rules import get_rule_by_id, list_rule_ids
 from tiresias.core.scoring import calculate_risk_score
 from tiresias.core.suppression import apply_suppressions
 from tiresias.renderers.explain import render_explain_list, render_explain_text
-from tiresias.renderers.json import render_json
+from tiresias.renderers.json import render_json_bytes
 from tiresias.renderers.text import render_text
 from tiresias.schemas.explain import RuleExplanation, RuleList
 from tiresias.schemas.report import (
@@ -374,17 +374,20 @@ def review_command(
             expired_suppressions=suppression_result.expired_suppressions,
         )
 
-        # Render output
+        # Render and write output; JSON stays as UTF-8 bytes end to end so
+        # file and stdout writes skip a decode/re-encode round trip
         if format == "json":
-            output_text = render_json(report)
+            output_bytes = render_json_bytes(report)
+            if output:
+                output.write_bytes(output_bytes)
+            else:
+                typer.echo(output_bytes)
         else:
             output_text = render_text(report, no_color, show_evidence, show_suppressed)
-
-        # Write output
-        if output:
-            output.write_text(output_text, encoding="utf-8")
-        else:
-            typer.echo(output_text)
+            if output:
+                output.write_text(output_text, encoding="utf-8")
+            else:
+                typer.echo(output_text)
 
         # Check fail-on condition (ignore suppressed findings)
         if fail_on != "none":
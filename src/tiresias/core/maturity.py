@@ -1,6 +1,9 @@
 """Document maturity assessment module."""
 
+import re
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass
@@ -10,7 +13,7 @@ class MaturityMetrics:
     char_count: int
     section_count: int
     core_sections_present: int
-    core_sections_found: list[str]
+    core_sections_found: tuple[str, ...]
 
 
 @dataclass
@@ -38,6 +41,43 @@ CORE_SECTION_PATTERNS = {
     "ownership": ["owner", "team", "on-call", "support"],
 }
 
+# Precompiled substring alternations, one per core section, so detection runs
+# as a single C-level scan per section instead of nested Python `in` loops
+_CORE_SECTION_REGEXES = {
+    section_name: re.compile("|".join(re.escape(p) for p in patterns))
+    for section_name, patterns in CORE_SECTION_PATTERNS.items()
+}
+
+# Prefilter matching any core keyword at all; sections that fail this single
+# scan (e.g. "a", "b" headings) skip the per-section regexes entirely
+_ANY_CORE_KEYWORD = re.compile(
+    "|".join(re.escape(p) for patterns in CORE_SECTION_PATTERNS.values() for p in patterns)
+)
+
+# Score points for document length and section count, indexed by
+# bisecting the bounds (e.g. char_count >= 5000 earns 25 points)
+_LENGTH_BOUNDS = (200, 500, 2000, 5000)
+_LENGTH_POINTS = (0, 5, 10, 20, 25)
+_SECTION_BOUNDS = (1, 3, 6, 10)
+_SECTION_POINTS = (0, 5, 10, 20, 25)
+
+# Maturity level cutoffs: scores below 25 are "notes", 25-49 "early_draft",
+# 50-74 "design_spec", 75+ "production_ready"
+_LEVEL_CUTS = (25, 50, 75)
+_LEVELS = ("notes", "early_draft", "design_spec", "production_ready")
+
+# Confidence from distance to the nearest level threshold: within 5 points is
+# "low", within 14 is "medium", 15 or more is "high"
+_CONFIDENCE_CUTS = (6, 15)
+_CONFIDENCES = ("low", "medium", "high")
+
+# Core sections that emit a dedicated "missing_*" signal when absent
+_MISSING_SECTION_SIGNALS = {
+    "goals_scope": "missing_goals",
+    "success_metrics": "missing_metrics",
+    "testing": "missing_testing",
+}
+
 
 def compute_maturity(content: str, sections: list[str]) -> MaturityResult:
     """
@@ -87,7 +127,20 @@ def compute_maturity(content: str, sections: list[str]) -> MaturityResult:
     )
 
 
-def _detect_core_sections(sections: list[str]) -> tuple[int, list[str]]:
+def compute_maturity_batch(docs: list[tuple[str, list[str]]]) -> list[MaturityResult]:
+    """
+    Compute maturity for a batch of documents.
+
+    Args:
+        docs: List of (content, sections) pairs, as accepted by compute_maturity
+
+    Returns:
+        List of MaturityResult, one per document, in input order
+    """
+    return [compute_maturity(content, sections) for content, sections in docs]
+
+
+def _detect_core_sections(sections: list[str]) -> tuple[int, tuple[str, ...]]:
     """
     Detect presence of 9 core sections.
 
@@ -95,18 +148,21 @@ def _detect_core_sections(sections: list[str]) -> tuple[int, list[str]]:
         sections: List of section headers (lowercase)
 
     Returns:
-        Tuple of (count_present, list_of_found_section_names)
+        Tuple of (count_present, names_of_found_sections)
     """
-    found = []
+    found: list[str] = []
+
+    # Drop sections that contain no core keyword before the per-section scans
+    candidates = [s for s in sections if _ANY_CORE_KEYWORD.search(s)]
+    if not candidates:
+        return 0, ()
 
-    for section_name, patterns in CORE_SECTION_PATTERNS.items():
+    for section_name, regex in _CORE_SECTION_REGEXES.items():
         # Check if any pattern matches any section
-        for section in sections:
-            if any(pattern in section for pattern in patterns):
-                found.append(section_name)
-                break
+        if any(regex.search(section) for section in candidates):
+            found.append(section_name)
 
-    return len(found), found
+    return len(found), tuple(found)
 
 
 def _calculate_score(metrics: MaturityMetrics) -> int:
@@ -124,36 +180,18 @@ def _calculate_score(metrics: MaturityMetrics) -> int:
     Returns:
         Score from 0-100
     """
-    score = 0
-
     # 1. Document Length (0-25 points)
-    if metrics.char_count >= 5000:
-        score += 25
-    elif metrics.char_count >= 2000:
-        score += 20
-    elif metrics.char_count >= 500:
-        score += 10
-    elif metrics.char_count >= 200:
-        score += 5
-    # else: 0 points
+    length_points = _LENGTH_POINTS[bisect_right(_LENGTH_BOUNDS, metrics.char_count)]
 
     # 2. Section Count (0-25 points)
-    if metrics.section_count >= 10:
-        score += 25
-    elif metrics.section_count >= 6:
-        score += 20
-    elif metrics.section_count >= 3:
-        score += 10
-    elif metrics.section_count >= 1:
-        score += 5
-    # else: 0 points
+    section_points = _SECTION_POINTS[bisect_right(_SECTION_BOUNDS, metrics.section_count)]
 
     # 3. Core Section Coverage (0-50 points)
     # Each core section present = 50/9 ≈ 5.56 points
-    score += int((metrics.core_sections_present / 9.0) * 50)
+    core_points = int((metrics.core_sections_present / 9.0) * 50)
 
     # Cap at 100
-    return min(100, score)
+    return min(100, length_points + section_points + core_points)
 
 
 def _determine_level(score: int) -> str:
@@ -166,14 +204,7 @@ def _determine_level(score: int) -> str:
     Returns:
         Level name: "notes", "early_draft", "design_spec", or "production_ready"
     """
-    if score >= 75:
-        return "production_ready"
-    elif score >= 50:
-        return "design_spec"
-    elif score >= 25:
-        return "early_draft"
-    else:
-        return "notes"
+    return _LEVELS[bisect_right(_LEVEL_CUTS, score)]
 
 
 def _calculate_confidence(score: int) -> str:
@@ -189,26 +220,18 @@ def _calculate_confidence(score: int) -> str:
     Returns:
         Confidence level: "low", "medium", or "high"
     """
-    # High confidence: clearly notes (<=10) or production-ready (>=90)
-    if score <= 10 or score >= 90:
-        return "high"
-
-    # Low confidence: near threshold boundaries
     # Thresholds: 25 (notes/early_draft), 50 (early_draft/design_spec), 75 (design_spec/prod)
-    if (20 <= score <= 30) or (45 <= score <= 55) or (70 <= score <= 80):
-        return "low"
+    distance = min(abs(score - 25), abs(score - 50), abs(score - 75))
+    return _CONFIDENCES[bisect_right(_CONFIDENCE_CUTS, distance)]
 
-    # Medium confidence: mid-range within a level
-    return "medium"
 
-
-def _generate_signals(metrics: MaturityMetrics, core_sections_found: list[str]) -> list[str]:
+def _generate_signals(metrics: MaturityMetrics, core_sections_found: tuple[str, ...]) -> list[str]:
     """
     Generate list of signals explaining the maturity assessment.
 
     Args:
         metrics: MaturityMetrics
-        core_sections_found: List of found core section names
+        core_sections_found: Names of found core sections
 
     Returns:
         List of signal strings
@@ -240,17 +263,16 @@ def _generate_signals(metrics: MaturityMetrics, core_sections_found: list[str])
     elif missing_critical <= 2:
         signals.append("comprehensive_coverage")
 
-    # Specific missing sections
-    if "goals_scope" not in core_sections_found:
-        signals.append("missing_goals")
-    if "success_metrics" not in core_sections_found:
-        signals.append("missing_metrics")
-    if "testing" not in core_sections_found:
-        signals.append("missing_testing")
+    # Specific missing sections (set membership instead of repeated list scans)
+    found_set = frozenset(core_sections_found)
+    signals.extend(
+        signal for section, signal in _MISSING_SECTION_SIGNALS.items() if section not in found_set
+    )
 
     return signals
 
 
+@lru_cache(maxsize=8)
 def _get_interpretation(level: str) -> str:
     """
     Get user-facing interpretation text for each level.
@@ -1,8 +1,23 @@
 """Risk scoring calculation."""
 
 from collections import Counter
+from itertools import islice
+from operator import attrgetter
 
-from tiresias.schemas.report import Finding, Severity
+from tiresias.schemas.report import Category, Finding, Severity
+
+# Points contributed per finding, by severity; built once at import
+_SEVERITY_POINTS = {
+    Severity.HIGH: 15,
+    Severity.MEDIUM: 8,
+    Severity.LOW: 3,
+}
+
+# Result for a clean report; matches _generate_explanation(0, {}, [])
+_EMPTY_RESULT = (0, "Risk score: 0/100 (Low)")
+
+# Pulls both scored attributes in one C-level call per finding
+_SEVERITY_AND_CATEGORY = attrgetter("severity", "category")
 
 
 def calculate_risk_score(
@@ -19,22 +34,24 @@ def calculate_risk_score(
     Returns:
         Tuple of (risk_score, explanation)
     """
-    # Severity point values
-    severity_points = {
-        Severity.HIGH: 15,
-        Severity.MEDIUM: 8,
-        Severity.LOW: 3,
-    }
-
-    # Calculate weighted score
+    # Clean reports are common; skip weight resolution and formatting
+    if not findings:
+        return _EMPTY_RESULT
+
+    # Resolve the string-keyed config weights into a table keyed by enum
+    # member once, so the loop avoids the string hash and default branch
+    weights = {c: category_weights.get(c.value, 1.0) for c in Category}
+
+    # Calculate weighted score; stop accumulating once the cap is reached
+    # since further findings cannot move the score
     total_score = 0.0
-    severity_counts: Counter = Counter()
+    for severity, category in map(_SEVERITY_AND_CATEGORY, findings):
+        total_score += _SEVERITY_POINTS[severity] * weights[category]
+        if total_score >= 100:
+            break
 
-    for finding in findings:
-        base_points = severity_points[finding.severity]
-        weight = category_weights.get(finding.category.value, 1.0)
-        total_score += base_points * weight
-        severity_counts[finding.severity] += 1
+    # The explanation still reports counts over all findings
+    severity_counts = Counter(finding.severity for finding in findings)
 
     # Cap at 100
     risk_score = min(100, int(total_score))
@@ -79,10 +96,10 @@ def _generate_explanation(
     if severity_parts:
         lines.append(f"Based on {', '.join(severity_parts)} finding(s).")
 
-    # Highlight top issues
-    high_findings = [f for f in findings if f.severity == Severity.HIGH]
-    if high_findings:
-        top_issues = [f.title for f in high_findings[:3]]
+    # Highlight top issues: first three high-severity findings, without
+    # materializing the full high-severity list
+    top_issues = [f.title for f in islice((f for f in findings if f.severity == Severity.HIGH), 3)]
+    if top_issues:
         lines.append(f"Primary risks: {', '.join(top_issues)}.")
 
     return " ".join(lines)
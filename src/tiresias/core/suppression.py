@@ -1,7 +1,8 @@
 """Suppression engine for filtering findings based on .tiresias.yml config."""
 
-from datetime import UTC, date, datetime
-from fnmatch import fnmatch
+from collections import Counter
+from collections.abc import Sequence
+from datetime import UTC, datetime
 
 from tiresias.schemas.config import SuppressionEntry, TiresiasConfig
 from tiresias.schemas.report import (
@@ -22,21 +23,28 @@ class SuppressionResult:
         suppressed_findings: list[Finding],
         expired_suppressions: list[ExpiredSuppression],
         warnings: list[str],
+        suppressed_by_severity: "Counter[Severity] | None" = None,
     ):
         self.visible_findings = visible_findings
         self.suppressed_findings = suppressed_findings
         self.expired_suppressions = expired_suppressions
         self.warnings = warnings
+        self._suppressed_by_severity = suppressed_by_severity
 
     def get_suppressed_summary(self) -> SuppressedSummary | None:
         """Generate suppressed findings summary."""
         if not self.suppressed_findings:
             return None
 
+        # Counts are accumulated during the match pass when available;
+        # otherwise fall back to one pass over the suppressed findings
+        counts = self._suppressed_by_severity
+        if counts is None:
+            counts = Counter(f.severity for f in self.suppressed_findings)
         by_severity = {
-            "high": sum(1 for f in self.suppressed_findings if f.severity == Severity.HIGH),
-            "medium": sum(1 for f in self.suppressed_findings if f.severity == Severity.MEDIUM),
-            "low": sum(1 for f in self.suppressed_findings if f.severity == Severity.LOW),
+            "high": counts[Severity.HIGH],
+            "medium": counts[Severity.MEDIUM],
+            "low": counts[Severity.LOW],
         }
 
         return SuppressedSummary(
@@ -73,37 +81,47 @@ def apply_suppressions(
 
     today = datetime.now(UTC).date()
 
-    # Validate suppressions and collect expired ones
-    active_suppressions: list[SuppressionEntry] = []
+    # Validate suppressions and collect expired ones; active entries are
+    # indexed by rule ID so each finding only sees its own candidates
+    active_suppressions: dict[str, list[SuppressionEntry]] = {}
     expired_suppressions: list[ExpiredSuppression] = []
     warnings: list[str] = []
 
     for suppression in config.suppressions:
-        # Check if expired
-        if suppression.expires:
-            expiry_date = date.fromisoformat(suppression.expires)
-            if expiry_date < today:
-                expired_suppressions.append(
-                    ExpiredSuppression(
-                        id=suppression.id,
-                        expires=suppression.expires,
-                        reason=suppression.reason,
-                    )
+        # Check if expired (expiry is parsed once per entry, not per call);
+        # expires is rebound locally so its narrowing carries into the append
+        expires = suppression.expires
+        expiry_date = suppression.expires_date
+        if expires is not None and expiry_date is not None and expiry_date < today:
+            expired_suppressions.append(
+                ExpiredSuppression(
+                    id=suppression.id,
+                    expires=expires,
+                    reason=suppression.reason,
                 )
-                continue
+            )
+            continue
+
+        # Profile and scope depend only on this call's arguments, never on
+        # the finding, so entries failing them are dropped here instead of
+        # being re-checked against every finding
+        if suppression.profiles and profile not in suppression.profiles_set:
+            continue
+        scope_regex = suppression.scope_regex
+        if scope_regex is not None and not any(map(scope_regex.match, input_files)):
+            continue
 
-        active_suppressions.append(suppression)
+        active_suppressions.setdefault(suppression.id, []).append(suppression)
 
-    # Apply active suppressions
+    # Apply active suppressions, counting suppressed severities as we go
     visible_findings: list[Finding] = []
     suppressed_findings: list[Finding] = []
+    suppressed_by_severity: Counter[Severity] = Counter()
 
     for finding in findings:
         suppression_match = _find_matching_suppression(
             finding,
-            active_suppressions,
-            profile,
-            input_files,
+            active_suppressions.get(finding.id, ()),
         )
 
         if suppression_match:
@@ -117,6 +135,7 @@ def apply_suppressions(
                 severities=suppression_match.severities,
             )
             suppressed_findings.append(finding)
+            suppressed_by_severity[finding.severity] += 1
         else:
             visible_findings.append(finding)
 
@@ -125,59 +144,22 @@ def apply_suppressions(
         suppressed_findings=suppressed_findings,
         expired_suppressions=expired_suppressions,
         warnings=warnings,
+        suppressed_by_severity=suppressed_by_severity,
     )
 
 
 def _find_matching_suppression(
     finding: Finding,
-    suppressions: list[SuppressionEntry],
-    profile: str,
-    input_files: list[str],
+    suppressions: Sequence[SuppressionEntry],
 ) -> SuppressionEntry | None:
-    """Find first suppression that matches this finding."""
+    """
+    Find first matching suppression among the candidates for this rule ID.
+
+    Candidates are pre-filtered by rule ID, expiry, profile and scope, so
+    only the severity filter still depends on the finding itself.
+    """
+    severity = finding.severity.value
     for suppression in suppressions:
-        if _suppression_matches_finding(finding, suppression, profile, input_files):
+        if not suppression.severities or severity in suppression.severities_set:
             return suppression
     return None
-
-
-def _suppression_matches_finding(
-    finding: Finding,
-    suppression: SuppressionEntry,
-    profile: str,
-    input_files: list[str],
-) -> bool:
-    """Check if suppression applies to this finding."""
-    # Rule ID must match
-    if finding.id != suppression.id:
-        return False
-
-    # Profile filter (if specified)
-    if suppression.profiles:
-        if profile not in suppression.profiles:
-            return False
-
-    # Severity filter (if specified)
-    if suppression.severities:
-        if finding.severity.value not in suppression.severities:
-            return False
-
-    # Scope filter (if specified)
-    if suppression.scope:
-        # At least one input file must match a scope glob
-        if not _any_file_matches_scope(input_files, suppression.scope):
-            return False
-
-    return True
-
-
-def _any_file_matches_scope(
-    input_files: list[str],
-    scope_globs: list[str],
-) -> bool:
-    """Check if any input file matches at least one scope glob."""
-    for file_path in input_files:
-        for glob_pattern in scope_globs:
-            if fnmatch(file_path, glob_pattern):
-                return True
-    return False
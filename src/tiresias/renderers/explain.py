@@ -2,10 +2,6 @@
 
 from io import StringIO
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
 from tiresias.core.rules import AnalysisRule
 
 
@@ -20,6 +16,9 @@ def render_explain_text(rule: AnalysisRule, no_color: bool = False) -> str:
     Returns:
         Formatted text output
     """
+    from rich.console import Console
+    from rich.panel import Panel
+
     output = StringIO()
     console = Console(file=output, force_terminal=not no_color, width=80)
 
@@ -71,6 +70,9 @@ def render_explain_list(rules: list[tuple[str, str]], no_color: bool = False) ->
     Returns:
         Formatted table output
     """
+    from rich.console import Console
+    from rich.table import Table
+
     output = StringIO()
     console = Console(file=output, force_terminal=not no_color, width=80)
 
@@ -2,19 +2,46 @@
 
 from tiresias.schemas.report import ReviewReport
 
+try:  # Optional fast path: install with `tiresias[perf]`
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
 
-def render_json(report: ReviewReport) -> str:
+
+def render_json_bytes(report: ReviewReport) -> bytes:
     """
-    Render report as JSON.
+    Render report as UTF-8 encoded JSON bytes.
+
+    Callers writing to a file or a binary stream should prefer this over
+    render_json: it avoids decoding to str only to re-encode on write.
 
     Args:
         report: Review report to render
 
     Returns:
-        JSON string (deterministic, sorted keys, indented)
+        JSON bytes (deterministic field order, indented)
     """
+    if orjson is not None:
+        return orjson.dumps(
+            report.model_dump(mode="json", exclude_none=True),
+            option=orjson.OPT_INDENT_2,
+        )
+
     return report.model_dump_json(
         indent=2,
         exclude_none=True,
         by_alias=False,
-    )
+    ).encode()
+
+
+def render_json(report: ReviewReport) -> str:
+    """
+    Render report as JSON.
+
+    Args:
+        report: Review report to render
+
+    Returns:
+        JSON string (deterministic field order, indented)
+    """
+    return render_json_bytes(report).decode()
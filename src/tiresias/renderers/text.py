@@ -1,19 +1,38 @@
 """Rich text output renderer."""
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from tiresias.schemas.report import Finding, ReviewReport, Severity
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-def _extract_evidence_lines(finding: Finding) -> list[str]:
+# Sentence-ending punctuation followed by whitespace; compiled once so
+# evidence splitting doesn't re-parse the pattern per finding
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+# Evidence lines displayed per severity (None = unlimited)
+_EVIDENCE_MAX_LINES = {Severity.HIGH: None, Severity.MEDIUM: 2, Severity.LOW: 1}
+
+# Panel/border color per maturity level, built once at import
+_MATURITY_COLORS = {
+    "notes": "bright_black",
+    "early_draft": "yellow",
+    "design_spec": "blue",
+    "production_ready": "green",
+}
+
+
+def _extract_evidence_lines(finding: Finding, max_lines: int | None = None) -> list[str]:
     """
     Extract evidence as a list of lines from a finding.
 
     Args:
         finding: Finding with evidence field
+        max_lines: Stop splitting once this many lines (plus one overflow
+            sentinel) have been collected; None means split everything
 
     Returns:
         List of evidence lines (sentences)
@@ -21,21 +40,45 @@ def _extract_evidence_lines(finding: Finding) -> list[str]:
     if not finding.evidence:
         return []
 
+    return list(_split_evidence(finding.evidence, max_lines))
+
+
+@lru_cache(maxsize=1024)
+def _split_evidence(evidence: str, max_lines: int | None) -> tuple[str, ...]:
+    """
+    Split evidence text into display lines, memoized per (text, limit).
+
+    The same finding is rendered repeatedly across invocations (and its
+    evidence string is identical each time), so the split is cached.
+
+    Args:
+        evidence: Non-empty evidence text
+        max_lines: Display limit used to bound the split; None = no limit
+
+    Returns:
+        Tuple of evidence lines (sentences)
+    """
     # Split by newlines first, then by sentence-ending punctuation
     lines: list[str] = []
-    for paragraph in finding.evidence.split("\n"):
+    for paragraph in evidence.split("\n"):
+        if max_lines is not None and len(lines) > max_lines:
+            break
+
         paragraph = paragraph.strip()
         if not paragraph:
             continue
 
         # Split into sentences (. ! ?)
-        # Keep the punctuation with each sentence
-        import re
-
-        sentences = re.split(r"(?<=[.!?])\s+", paragraph)
+        # Keep the punctuation with each sentence. When a display limit is
+        # known, stop scanning once one extra sentence (to detect overflow)
+        # has been produced.
+        if max_lines is None:
+            sentences = _SENTENCE_SPLIT.split(paragraph)
+        else:
+            sentences = _SENTENCE_SPLIT.split(paragraph, maxsplit=max_lines + 1 - len(lines))
         lines.extend(s.strip() for s in sentences if s.strip())
 
-    return lines
+    return tuple(lines)
 
 
 def _truncate_evidence(lines: list[str], severity: Severity) -> list[str]:
@@ -53,12 +96,7 @@ def _truncate_evidence(lines: list[str], severity: Severity) -> list[str]:
         return []
 
     # Severity-based line limits
-    if severity == Severity.HIGH:
-        max_lines = None  # Unlimited
-    elif severity == Severity.MEDIUM:
-        max_lines = 2
-    else:  # LOW
-        max_lines = 1
+    max_lines = _EVIDENCE_MAX_LINES.get(severity, 1)
 
     if max_lines is None:
         return lines
@@ -92,6 +130,8 @@ def render_text(
     Returns:
         Formatted text output
     """
+    from rich.console import Console
+
     console = Console(
         force_terminal=not no_color,
         force_interactive=False,
@@ -115,8 +155,11 @@ def render_text(
     return capture.get()
 
 
-def _render_header(console: Console, report: ReviewReport) -> None:
+def _render_header(console: "Console", report: ReviewReport) -> None:
     """Render header with metadata."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     header_text = Text()
     header_text.append("Tiresias Design Review Report\n", style="bold cyan")
     header_text.append(f"Version: {report.metadata.tool_version}  ", style="dim")
@@ -128,18 +171,15 @@ def _render_header(console: Console, report: ReviewReport) -> None:
     console.print()
 
 
-def _render_maturity(console: Console, report: ReviewReport) -> None:
+def _render_maturity(console: "Console", report: ReviewReport) -> None:
     """Render document maturity assessment."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     maturity = report.maturity
 
     # Determine color based on maturity level
-    color_map = {
-        "notes": "bright_black",
-        "early_draft": "yellow",
-        "design_spec": "blue",
-        "production_ready": "green",
-    }
-    color = color_map.get(maturity.level, "white")
+    color = _MATURITY_COLORS.get(maturity.level, "white")
 
     # Format level name for display
     level_display = maturity.level.replace("_", " ").title()
@@ -156,8 +196,11 @@ def _render_maturity(console: Console, report: ReviewReport) -> None:
     console.print()
 
 
-def _render_risk_score(console: Console, report: ReviewReport) -> None:
+def _render_risk_score(console: "Console", report: ReviewReport) -> None:
     """Render risk score with gauge."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     score = report.risk_score
 
     # Determine color
@@ -195,7 +238,7 @@ def _render_risk_score(console: Console, report: ReviewReport) -> None:
 
 
 def _render_findings(
-    console: Console,
+    console: "Console",
     report: ReviewReport,
     show_evidence: bool = False,
     show_suppressed: bool = False,
@@ -233,9 +276,12 @@ def _render_findings(
 
 
 def _render_findings_table(
-    console: Console, findings: list, color: str, show_evidence: bool = False
+    console: "Console", findings: list, color: str, show_evidence: bool = False
 ) -> None:
     """Render a table of findings with optional evidence blocks."""
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(
         show_header=True,
         header_style=f"bold {color}",
@@ -264,7 +310,9 @@ def _render_findings_table(
     # Display evidence blocks under the table if requested
     if show_evidence:
         for finding in findings:
-            evidence_lines = _extract_evidence_lines(finding)
+            evidence_lines = _extract_evidence_lines(
+                finding, max_lines=_EVIDENCE_MAX_LINES.get(finding.severity, 1)
+            )
             if not evidence_lines:
                 continue
 
@@ -284,11 +332,14 @@ def _render_findings_table(
                     console.print(bullet_text)
 
 
-def _render_baseline_comparison(console: Console, report: ReviewReport) -> None:
+def _render_baseline_comparison(console: "Console", report: ReviewReport) -> None:
     """Render baseline comparison summary."""
     if not report.comparison:
         return
 
+    from rich.panel import Panel
+    from rich.text import Text
+
     comp = report.comparison
     baseline_sum = comp.baseline_summary
 
@@ -320,7 +371,7 @@ def _render_baseline_comparison(console: Console, report: ReviewReport) -> None:
     console.print()
 
 
-def _render_assumptions(console: Console, report: ReviewReport) -> None:
+def _render_assumptions(console: "Console", report: ReviewReport) -> None:
     """Render identified assumptions."""
     if not report.assumptions:
         return
@@ -331,7 +382,7 @@ def _render_assumptions(console: Console, report: ReviewReport) -> None:
     console.print()
 
 
-def _render_questions(console: Console, report: ReviewReport) -> None:
+def _render_questions(console: "Console", report: ReviewReport) -> None:
     """Render open questions."""
     if not report.open_questions:
         return
@@ -342,11 +393,14 @@ def _render_questions(console: Console, report: ReviewReport) -> None:
     console.print()
 
 
-def _render_suppressed_summary(console: Console, report: ReviewReport) -> None:
+def _render_suppressed_summary(console: "Console", report: ReviewReport) -> None:
     """Render suppressed findings summary."""
     if not report.suppressed_summary:
         return
 
+    from rich.panel import Panel
+    from rich.text import Text
+
     summary = report.suppressed_summary
 
     summary_text = Text()
@@ -361,11 +415,14 @@ def _render_suppressed_summary(console: Console, report: ReviewReport) -> None:
     console.print()
 
 
-def _render_expired_suppressions(console: Console, report: ReviewReport) -> None:
+def _render_expired_suppressions(console: "Console", report: ReviewReport) -> None:
     """Render expired suppression warnings."""
     if not report.expired_suppressions:
         return
 
+    from rich.panel import Panel
+    from rich.text import Text
+
     warning_text = Text()
     warning_text.append("⚠ Expired Suppressions Detected\n\n", style="bold yellow")
     warning_text.append(
@@ -382,11 +439,14 @@ def _render_expired_suppressions(console: Console, report: ReviewReport) -> None
     console.print()
 
 
-def _render_summary(console: Console, report: ReviewReport) -> None:
+def _render_summary(console: "Console", report: ReviewReport) -> None:
     """Render quick summary."""
     if not report.quick_summary:
         return
 
+    from rich.panel import Panel
+    from rich.text import Text
+
     summary_text = Text()
     summary_text.append("Quick Summary\n\n", style="bold")
     for bullet in report.quick_summary:
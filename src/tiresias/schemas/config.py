@@ -1,21 +1,33 @@
 """Configuration schema for .tiresias.yml."""
 
+import re
+import sys
 from datetime import date
+from fnmatch import translate
+from functools import cached_property, lru_cache
 
 from pydantic import BaseModel, Field, field_validator
 
 
+@lru_cache(maxsize=256)
+def _compile_scope_globs(scope: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a tuple of globs into one alternation, cached across config loads."""
+    return re.compile("|".join(f"(?:{translate(pattern)})" for pattern in scope))
+
+
 class SuppressionEntry(BaseModel):
     """A single suppression rule."""
 
     id: str = Field(..., description="Rule ID to suppress (e.g., ARCH-001)")
     reason: str = Field(..., description="Human justification for suppression")
     expires: str | None = Field(None, description="Expiry date YYYY-MM-DD (optional)")
-    scope: list[str] | None = Field(None, description="Glob patterns for file paths (optional)")
-    profiles: list[str] | None = Field(
+    scope: tuple[str, ...] | None = Field(
+        None, description="Glob patterns for file paths (optional)"
+    )
+    profiles: tuple[str, ...] | None = Field(
         None, description="Profiles where suppression applies (optional)"
     )
-    severities: list[str] | None = Field(
+    severities: tuple[str, ...] | None = Field(
         None, description="Severities where suppression applies (optional)"
     )
 
@@ -26,6 +38,30 @@ class SuppressionEntry(BaseModel):
             raise ValueError("Suppression reason cannot be empty")
         return v.strip()
 
+    @cached_property
+    def scope_regex(self) -> re.Pattern[str] | None:
+        """All scope globs compiled into one alternation (None if scope unset)."""
+        if not self.scope:
+            return None
+        return _compile_scope_globs(self.scope)
+
+    @cached_property
+    def severities_set(self) -> frozenset[str]:
+        """Severity filter as a frozenset (empty if unset)."""
+        # Interned so membership tests against Severity.value (an interned
+        # literal) hit the identity fast path before full comparison
+        return frozenset(sys.intern(s) for s in self.severities or ())
+
+    @cached_property
+    def profiles_set(self) -> frozenset[str]:
+        """Profile filter as a frozenset (empty if unset)."""
+        return frozenset(self.profiles or ())
+
+    @cached_property
+    def expires_date(self) -> date | None:
+        """Expiry parsed to a date once per entry (None if no expiry set)."""
+        return date.fromisoformat(self.expires) if self.expires else None
+
     @field_validator("expires")
     @classmethod
     def expires_must_be_valid_date(cls, v: str | None) -> str | None:
@@ -31,9 +31,9 @@ class SuppressionInfo(BaseModel):
 
     reason: str = Field(..., description="Justification for suppression")
     expires: str | None = Field(None, description="Expiry date if set")
-    scope: list[str] | None = Field(None, description="Scope globs if set")
-    profiles: list[str] | None = Field(None, description="Profiles if set")
-    severities: list[str] | None = Field(None, description="Severities if set")
+    scope: tuple[str, ...] | None = Field(None, description="Scope globs if set")
+    profiles: tuple[str, ...] | None = Field(None, description="Profiles if set")
+    severities: tuple[str, ...] | None = Field(None, description="Severities if set")
 
 
 class Finding(BaseModel):
@@ -72,7 +72,7 @@ class MaturityMetrics(BaseModel):
     char_count: int = Field(..., description="Total character count")
     section_count: int = Field(..., description="Number of sections detected")
     core_sections_present: int = Field(..., description="Count of core sections found")
-    core_sections_found: list[str] = Field(..., description="Names of found core sections")
+    core_sections_found: tuple[str, ...] = Field(..., description="Names of found core sections")
 
 
 class Maturity(BaseModel):
@@ -1,7 +1,45 @@
 """Pytest fixtures and configuration."""
 
+from typing import TYPE_CHECKING
+
 import pytest
 
+if TYPE_CHECKING:
+    import typer
+    from typer.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def cli_app() -> "typer.Typer":
+    """The Tiresias CLI app, imported lazily.
+
+    Importing here (rather than at module level in CLI test files) keeps the
+    Typer/Rich/Click import cost out of test modules that never touch the CLI.
+    """
+    from tiresias.cli.app import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def runner() -> "CliRunner":
+    """Shared CliRunner for invoking the CLI app."""
+    from typer.testing import CliRunner
+
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def large_blob() -> bytes:
+    """A 300 KB payload for large-file tests (built once per session)."""
+    return b"x" * 300_000
+
+
+@pytest.fixture(scope="session")
+def suppressed_config_body() -> str:
+    """Shared .tiresias.yml contents for suppression tests (built once per session)."""
+    return "suppressions:\n  - id: REQ-001\n    reason: Accepted risk for this test\n"
+
 
 @pytest.fixture
 def sample_design_doc() -> str:
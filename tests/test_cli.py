@@ -2,128 +2,150 @@
 
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from typer.testing import CliRunner
+if TYPE_CHECKING:
+    import typer
+    from typer.testing import CliRunner
 
-from tiresias.cli.app import app
 
-runner = CliRunner()
-
-
-def test_cli_version() -> None:
+def test_cli_version(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test --version flag."""
-    result = runner.invoke(app, ["--version"])
+    result = runner.invoke(cli_app, ["--version"])
 
     assert result.exit_code == 0
     assert "0.6.0" in result.output
 
 
-def test_cli_help() -> None:
+def test_cli_help(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test that help text is shown."""
-    result = runner.invoke(app, ["--help"])
+    result = runner.invoke(cli_app, ["--help"])
 
     assert result.exit_code == 0
     assert "tiresias" in result.output.lower()
     assert "review" in result.output
 
 
-def test_cli_review_single_file(tmp_path: Path) -> None:
+def test_cli_review_single_file(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test CLI with a single file."""
     test_file = tmp_path / "test.md"
     test_file.write_text("# Design\nSome content")
 
-    result = runner.invoke(app, ["review", str(test_file)])
+    result = runner.invoke(cli_app, ["review", str(test_file)])
 
     assert result.exit_code == 0
     assert "Tiresias" in result.stdout
 
 
-def test_cli_json_output(tmp_path: Path) -> None:
+def test_cli_json_output(tmp_path: Path, runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test JSON output format."""
     test_file = tmp_path / "test.md"
     test_file.write_text("# Design\nMinimal content")
 
-    result = runner.invoke(app, ["review", str(test_file), "--format", "json"])
+    result = runner.invoke(cli_app, ["review", str(test_file), "--format", "json"])
 
     assert result.exit_code == 0
     # Should be valid JSON
-    parsed = json.loads(result.stdout)
+    parsed = json.loads(result.stdout_bytes)
     assert "metadata" in parsed
     assert "findings" in parsed
     assert "risk_score" in parsed
 
 
-def test_cli_fail_on_high() -> None:
+def test_cli_fail_on_high(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test --fail-on high option."""
     # This would require a more complex setup with actual files
     # For now, we test the logic indirectly through other tests
     pass
 
 
-def test_cli_review_nonexistent_file() -> None:
+def test_cli_review_nonexistent_file(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test CLI with nonexistent file."""
-    result = runner.invoke(app, ["review", "/nonexistent/file.md"])
+    result = runner.invoke(cli_app, ["review", "/nonexistent/file.md"])
 
     assert result.exit_code == 3
     assert "Error" in result.output
 
 
-def test_cli_review_default_no_evidence(tmp_path: Path) -> None:
+def test_cli_review_default_no_evidence(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that evidence is hidden by default."""
     test_file = tmp_path / "test.md"
     test_file.write_text("# Design\nSome content")
 
-    result = runner.invoke(app, ["review", str(test_file), "--no-color"])
+    result = runner.invoke(cli_app, ["review", str(test_file), "--no-color"])
 
     assert result.exit_code == 0
     assert "Evidence:" not in result.stdout
 
 
-def test_cli_review_show_evidence_flag(tmp_path: Path) -> None:
+def test_cli_review_show_evidence_flag(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that --show-evidence displays evidence."""
     test_file = tmp_path / "test.md"
     test_file.write_text("# Design\nSome content")
 
-    result = runner.invoke(app, ["review", str(test_file), "--show-evidence", "--no-color"])
+    result = runner.invoke(cli_app, ["review", str(test_file), "--show-evidence", "--no-color"])
 
     assert result.exit_code == 0
     assert "Evidence:" in result.stdout
 
 
-def test_cli_review_verbose_alias(tmp_path: Path) -> None:
+def test_cli_review_verbose_alias(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that --verbose alias works."""
     test_file = tmp_path / "test.md"
     test_file.write_text("# Design\nSome content")
 
-    result = runner.invoke(app, ["review", str(test_file), "--verbose", "--no-color"])
+    result = runner.invoke(cli_app, ["review", str(test_file), "--verbose", "--no-color"])
 
     assert result.exit_code == 0
     assert "Evidence:" in result.stdout
 
 
-def test_cli_maturity_in_text_output(tmp_path: Path) -> None:
+def test_cli_maturity_in_text_output(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that maturity appears in text output."""
     doc = tmp_path / "test.md"
     doc.write_text("# Design\nVery short document.")
 
-    result = runner.invoke(app, ["review", str(doc), "--no-color"])
+    result = runner.invoke(cli_app, ["review", str(doc), "--no-color"])
 
     assert result.exit_code == 0
-    assert "Document Maturity" in result.stdout
-    assert "Level:" in result.stdout
-    assert "Score:" in result.stdout
-    assert "Signals:" in result.stdout
+    expected_labels = ["Document Maturity", "Level:", "Score:", "Signals:"]
+    missing = [label for label in expected_labels if label not in result.stdout]
+    assert not missing, f"Labels missing from maturity output: {missing}"
 
 
-def test_cli_maturity_in_json_output(tmp_path: Path) -> None:
+def test_cli_maturity_in_json_output(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that maturity appears in JSON output."""
     doc = tmp_path / "test.md"
     doc.write_text("# Design\nVery short document.")
 
-    result = runner.invoke(app, ["review", str(doc), "--format", "json"])
+    result = runner.invoke(cli_app, ["review", str(doc), "--format", "json"])
 
     assert result.exit_code == 0
-    report = json.loads(result.stdout)
+    report = json.loads(result.stdout_bytes)
     assert "maturity" in report
     assert report["maturity"]["level"] in [
         "notes",
@@ -138,31 +160,39 @@ def test_cli_maturity_in_json_output(tmp_path: Path) -> None:
     assert "metrics" in report["maturity"]
 
 
-def test_cli_baseline_invalid_ref(tmp_path: Path) -> None:
+def test_cli_baseline_invalid_ref(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test baseline mode with invalid git ref."""
     test_file = tmp_path / "test.md"
     test_file.write_text("# Design\nSome content")
 
-    result = runner.invoke(app, ["review", str(test_file), "--baseline", "invalid-ref-xyz"])
+    result = runner.invoke(cli_app, ["review", str(test_file), "--baseline", "invalid-ref-xyz"])
 
     assert result.exit_code == 3
     assert "Error" in result.output
     assert "baseline" in result.output.lower() or "invalid" in result.output.lower()
 
 
-def test_cli_baseline_json_output_fields(tmp_path: Path) -> None:
+def test_cli_baseline_json_output_fields(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that baseline mode adds expected fields to JSON output."""
     # Note: This test runs in the actual tiresias repo, so baseline will work
     test_file = tmp_path / "test.md"
     test_file.write_text("# Design\nMinimal content")
 
     result = runner.invoke(
-        app, ["review", str(test_file), "--baseline", "HEAD", "--format", "json"]
+        cli_app, ["review", str(test_file), "--baseline", "HEAD", "--format", "json"]
     )
 
     # If this fails due to not being in git repo, that's expected in some test environments
     if result.exit_code == 0:
-        report = json.loads(result.stdout)
+        report = json.loads(result.stdout_bytes)
         assert "baseline_ref" in report
         assert report["baseline_ref"] == "HEAD"
         assert "comparison" in report
@@ -175,12 +205,16 @@ def test_cli_baseline_json_output_fields(tmp_path: Path) -> None:
             assert "maturity_regressed" in report["comparison"]
 
 
-def test_cli_baseline_text_output_shows_comparison(tmp_path: Path) -> None:
+def test_cli_baseline_text_output_shows_comparison(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that baseline mode shows comparison summary in text output."""
     test_file = tmp_path / "test.md"
     test_file.write_text("# Design\nSome content")
 
-    result = runner.invoke(app, ["review", str(test_file), "--baseline", "HEAD", "--no-color"])
+    result = runner.invoke(cli_app, ["review", str(test_file), "--baseline", "HEAD", "--no-color"])
 
     # If in git repo, should show baseline comparison
     if result.exit_code == 0:
@@ -190,14 +224,18 @@ def test_cli_baseline_text_output_shows_comparison(tmp_path: Path) -> None:
             assert "Baseline:" in output or "New:" in output or "Worsened:" in output
 
 
-def test_cli_baseline_fail_on_with_new_findings(tmp_path: Path) -> None:
+def test_cli_baseline_fail_on_with_new_findings(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that --fail-on works with baseline mode (checks new/worsened only)."""
     # Create a minimal doc that will have HIGH findings
     test_file = tmp_path / "test.md"
     test_file.write_text("# Widget Service\nWe will build a widget service.")
 
     # Without baseline, should fail with HIGH findings
-    result = runner.invoke(app, ["review", str(test_file), "--fail-on", "high"])
+    result = runner.invoke(cli_app, ["review", str(test_file), "--fail-on", "high"])
 
     # This document should have high-severity findings
     # Exit code 1 means findings were found and fail-on triggered
@@ -205,16 +243,18 @@ def test_cli_baseline_fail_on_with_new_findings(tmp_path: Path) -> None:
     assert result.exit_code in (0, 1)  # Either way is valid depending on findings
 
 
-def test_cli_suppressions_hide_by_default(tmp_path: Path) -> None:
+def test_cli_suppressions_hide_by_default(
+    tmp_path: Path,
+    suppressed_config_body: str,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that suppressed findings are hidden by default."""
     doc = tmp_path / "test.md"
     doc.write_text("# Design\nMinimal content")
 
     config = tmp_path / ".tiresias.yml"
-    config.write_text("""suppressions:
-  - id: REQ-001
-    reason: Accepted risk for this test
-""")
+    config.write_text(suppressed_config_body)
 
     # Run from tmp_path so config is found
     import os
@@ -222,7 +262,7 @@ def test_cli_suppressions_hide_by_default(tmp_path: Path) -> None:
     original_dir = os.getcwd()
     try:
         os.chdir(tmp_path)
-        result = runner.invoke(app, ["review", str(doc), "--no-color"])
+        result = runner.invoke(cli_app, ["review", str(doc), "--no-color"])
     finally:
         os.chdir(original_dir)
 
@@ -233,16 +273,18 @@ def test_cli_suppressions_hide_by_default(tmp_path: Path) -> None:
     assert "[SUPPRESSED]" not in result.stdout
 
 
-def test_cli_suppressions_show_with_flag(tmp_path: Path) -> None:
+def test_cli_suppressions_show_with_flag(
+    tmp_path: Path,
+    suppressed_config_body: str,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that --show-suppressed displays suppressed findings."""
     doc = tmp_path / "test.md"
     doc.write_text("# Design\nMinimal content")
 
     config = tmp_path / ".tiresias.yml"
-    config.write_text("""suppressions:
-  - id: REQ-001
-    reason: Accepted risk for this test
-""")
+    config.write_text(suppressed_config_body)
 
     # Run from tmp_path so config is found
     import os
@@ -250,7 +292,7 @@ def test_cli_suppressions_show_with_flag(tmp_path: Path) -> None:
     original_dir = os.getcwd()
     try:
         os.chdir(tmp_path)
-        result = runner.invoke(app, ["review", str(doc), "--show-suppressed", "--no-color"])
+        result = runner.invoke(cli_app, ["review", str(doc), "--show-suppressed", "--no-color"])
     finally:
         os.chdir(original_dir)
 
@@ -259,7 +301,11 @@ def test_cli_suppressions_show_with_flag(tmp_path: Path) -> None:
     assert "[SUPPRESSED]" in result.stdout
 
 
-def test_cli_suppressions_in_json_output(tmp_path: Path) -> None:
+def test_cli_suppressions_in_json_output(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that JSON output includes suppression metadata."""
     doc = tmp_path / "test.md"
     doc.write_text("# Design\nMinimal content")
@@ -272,10 +318,10 @@ suppressions:
     expires: 2030-12-31
 """)
 
-    result = runner.invoke(app, ["review", str(doc), "--format", "json"])
+    result = runner.invoke(cli_app, ["review", str(doc), "--format", "json"])
 
     assert result.exit_code == 0
-    report = json.loads(result.stdout)
+    report = json.loads(result.stdout_bytes)
 
     # Check for suppression fields in findings
     suppressed_findings = [f for f in report["findings"] if f.get("suppressed", False)]
@@ -291,7 +337,11 @@ suppressions:
         assert "by_severity" in report["suppressed_summary"]
 
 
-def test_cli_expired_suppression_warning(tmp_path: Path) -> None:
+def test_cli_expired_suppression_warning(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test that expired suppressions generate warnings."""
     doc = tmp_path / "test.md"
     # Create a document that triggers REQ-001
@@ -310,21 +360,10 @@ Some architecture details.
     expires: 2020-01-01
 """)
 
-    # Run from tmp_path so config is found
-    import os
-
-    original_dir = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        result = runner.invoke(app, ["review", str(doc), "--no-color"])
-    finally:
-        os.chdir(original_dir)
+    result = runner.invoke(cli_app, ["review", str(doc), "--format", "json"])
 
     assert result.exit_code == 0
-    # Should show expired suppression warning if REQ-001 actually fired
-    # Check JSON output for more reliable assertion
-    result_json = runner.invoke(app, ["review", str(doc), "--format", "json"])
-    report = json.loads(result_json.stdout)
+    report = json.loads(result.stdout_bytes)
     # If the suppression exists and is expired, it should be in expired_suppressions
     # regardless of whether the rule actually fired
     assert "expired_suppressions" in report
@@ -2,13 +2,16 @@
 
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from typer.testing import CliRunner
+import pytest
 
-from tiresias.cli.app import app
+if TYPE_CHECKING:
+    import typer
+    from typer.testing import CliRunner
 
 
-def test_e2e_basic_review(tmp_path: Path) -> None:
+def test_e2e_basic_review(tmp_path: Path, runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test end-to-end review workflow."""
     # Create a sample design doc
     doc = tmp_path / "design.md"
@@ -34,13 +37,12 @@ The service will integrate with Stripe API.
 """
     )
 
-    runner = CliRunner()
-    result = runner.invoke(app, ["review", str(doc), "--format", "json"])
+    result = runner.invoke(cli_app, ["review", str(doc), "--format", "json"])
 
     assert result.exit_code == 0
 
     # Parse JSON output
-    report = json.loads(result.stdout)
+    report = json.loads(result.stdout_bytes)
 
     # Basic structure checks
     assert "metadata" in report
@@ -56,7 +58,7 @@ The service will integrate with Stripe API.
     assert 0 <= report["risk_score"] <= 100
 
 
-def test_e2e_security_profile(tmp_path: Path) -> None:
+def test_e2e_security_profile(tmp_path: Path, runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test security profile filtering."""
     doc = tmp_path / "api-design.md"
     doc.write_text(
@@ -72,14 +74,13 @@ New REST API for user management.
 """
     )
 
-    runner = CliRunner()
     result = runner.invoke(
-        app,
+        cli_app,
         ["review", str(doc), "--format", "json", "--profile", "security"],
     )
 
     assert result.exit_code == 0
-    report = json.loads(result.stdout)
+    report = json.loads(result.stdout_bytes)
 
     # Security profile should flag missing security considerations
     assert any(
@@ -87,37 +88,38 @@ New REST API for user management.
     )
 
 
-def test_e2e_severity_threshold(tmp_path: Path) -> None:
+def test_e2e_severity_threshold(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test severity threshold filtering."""
     doc = tmp_path / "design.md"
     doc.write_text("# Minimal Design Doc\nSome content")
 
-    runner = CliRunner()
-
     # Run with high threshold
     result = runner.invoke(
-        app,
+        cli_app,
         ["review", str(doc), "--format", "json", "--severity-threshold", "high"],
     )
 
     assert result.exit_code == 0
-    report = json.loads(result.stdout)
+    report = json.loads(result.stdout_bytes)
 
     # Should only show high severity findings
     if report["findings"]:
         assert all(f["severity"] == "high" for f in report["findings"])
 
 
-def test_e2e_output_to_file(tmp_path: Path) -> None:
+def test_e2e_output_to_file(tmp_path: Path, runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test writing output to file."""
     doc = tmp_path / "design.md"
     doc.write_text("# Design\nContent")
 
     output_file = tmp_path / "report.json"
 
-    runner = CliRunner()
     result = runner.invoke(
-        app,
+        cli_app,
         [
             "review",
             str(doc),
@@ -132,18 +134,17 @@ def test_e2e_output_to_file(tmp_path: Path) -> None:
     assert output_file.exists()
 
     # Verify output file content
-    report = json.loads(output_file.read_text())
+    report = json.loads(output_file.read_bytes())
     assert "metadata" in report
     assert "findings" in report
 
 
-def test_e2e_text_output(tmp_path: Path) -> None:
+def test_e2e_text_output(tmp_path: Path, runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test text output format."""
     doc = tmp_path / "design.md"
     doc.write_text("# Design Document\nMinimal content")
 
-    runner = CliRunner()
-    result = runner.invoke(app, ["review", str(doc), "--format", "text"])
+    result = runner.invoke(cli_app, ["review", str(doc), "--format", "text"])
 
     assert result.exit_code == 0
     # Should contain expected sections
@@ -151,22 +152,30 @@ def test_e2e_text_output(tmp_path: Path) -> None:
     assert "Risk Score" in result.stdout
 
 
-def test_e2e_maturity_notes_document(tmp_path: Path) -> None:
+def test_e2e_maturity_notes_document(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test full pipeline with notes-level document."""
     doc = tmp_path / "notes.md"
     doc.write_text("# Idea\nQuick thought about feature X.")
 
-    runner = CliRunner()
-    result = runner.invoke(app, ["review", str(doc), "--format", "json"])
+    result = runner.invoke(cli_app, ["review", str(doc), "--format", "json"])
 
     assert result.exit_code == 0
-    report = json.loads(result.stdout)
+    report = json.loads(result.stdout_bytes)
     assert report["maturity"]["level"] == "notes"
     assert report["maturity"]["score"] < 25
     assert "very_short_length" in report["maturity"]["signals"]
 
 
-def test_e2e_maturity_comprehensive_document(tmp_path: Path) -> None:
+@pytest.mark.slow
+def test_e2e_maturity_comprehensive_document(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test full pipeline with production-ready document."""
     doc = tmp_path / "comprehensive.md"
     doc.write_text(
@@ -222,11 +231,10 @@ On-call: @platform-oncall
 """
     )
 
-    runner = CliRunner()
-    result = runner.invoke(app, ["review", str(doc), "--format", "json"])
+    result = runner.invoke(cli_app, ["review", str(doc), "--format", "json"])
 
     assert result.exit_code == 0
-    report = json.loads(result.stdout)
+    report = json.loads(result.stdout_bytes)
     assert report["maturity"]["level"] in ["design_spec", "production_ready"]
     assert report["maturity"]["score"] >= 50
     assert report["maturity"]["metrics"]["core_sections_present"] >= 7
@@ -2,17 +2,16 @@
 
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from typer.testing import CliRunner
+if TYPE_CHECKING:
+    import typer
+    from typer.testing import CliRunner
 
-from tiresias.cli.app import app
 
-runner = CliRunner()
-
-
-def test_explain_known_rule_text() -> None:
+def test_explain_known_rule_text(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test explaining a known rule in text format."""
-    result = runner.invoke(app, ["explain", "REQ-001"])
+    result = runner.invoke(cli_app, ["explain", "REQ-001"])
 
     assert result.exit_code == 0
     assert "REQ-001" in result.stdout
@@ -24,14 +23,14 @@ def test_explain_known_rule_text() -> None:
     assert "How to address it:" in result.stdout
 
 
-def test_explain_known_rule_json() -> None:
+def test_explain_known_rule_json(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test explaining a known rule in JSON format."""
-    result = runner.invoke(app, ["explain", "REQ-001", "--format", "json"])
+    result = runner.invoke(cli_app, ["explain", "REQ-001", "--format", "json"])
 
     assert result.exit_code == 0
 
     # Parse and validate JSON
-    parsed = json.loads(result.stdout)
+    parsed = json.loads(result.stdout_bytes)
     assert parsed["id"] == "REQ-001"
     assert parsed["title"] == "Missing success metrics"
     assert parsed["severity"] == "high"
@@ -42,18 +41,18 @@ def test_explain_known_rule_json() -> None:
     assert "pitfalls" in parsed
 
 
-def test_explain_unknown_rule() -> None:
+def test_explain_unknown_rule(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test explaining an unknown rule ID."""
-    result = runner.invoke(app, ["explain", "INVALID-999"])
+    result = runner.invoke(cli_app, ["explain", "INVALID-999"])
 
     assert result.exit_code == 3
     assert "INVALID-999" in result.output
     assert "--list" in result.output or "explain --list" in result.output
 
 
-def test_explain_list_text() -> None:
+def test_explain_list_text(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test listing all rules in text format."""
-    result = runner.invoke(app, ["explain", "--list"])
+    result = runner.invoke(cli_app, ["explain", "--list"])
 
     assert result.exit_code == 0
     assert "Available Rules" in result.stdout
@@ -73,21 +72,21 @@ def test_explain_list_text() -> None:
         "PERF-001",
         "DOC-001",
     ]
-    for rule_id in expected_rules:
-        assert rule_id in result.stdout
+    missing = [rule_id for rule_id in expected_rules if rule_id not in result.stdout]
+    assert not missing, f"Rules missing from list output: {missing}"
 
     assert "Rule ID" in result.stdout or "rule" in result.stdout.lower()
     assert "Title" in result.stdout or "title" in result.stdout.lower()
 
 
-def test_explain_list_json() -> None:
+def test_explain_list_json(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test listing all rules in JSON format."""
-    result = runner.invoke(app, ["explain", "--list", "--format", "json"])
+    result = runner.invoke(cli_app, ["explain", "--list", "--format", "json"])
 
     assert result.exit_code == 0
 
     # Parse and validate JSON
-    parsed = json.loads(result.stdout)
+    parsed = json.loads(result.stdout_bytes)
     assert "rules" in parsed
     assert len(parsed["rules"]) == 12
 
@@ -97,31 +96,35 @@ def test_explain_list_json() -> None:
     assert "title" in first_rule
 
 
-def test_explain_no_args_no_list() -> None:
+def test_explain_no_args_no_list(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test explain with no arguments and no --list flag."""
-    result = runner.invoke(app, ["explain"])
+    result = runner.invoke(cli_app, ["explain"])
 
     assert result.exit_code == 2
     assert "Error" in result.output or "error" in result.output.lower()
     assert "rule ID" in result.output or "RULE_ID" in result.output
 
 
-def test_explain_output_to_file(tmp_path: Path) -> None:
+def test_explain_output_to_file(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test writing explain output to a file."""
     output_file = tmp_path / "explanation.txt"
-    result = runner.invoke(app, ["explain", "REQ-001", "--output", str(output_file)])
+    result = runner.invoke(cli_app, ["explain", "REQ-001", "--output", str(output_file)])
 
     assert result.exit_code == 0
     assert output_file.exists()
 
-    content = output_file.read_text()
-    assert "REQ-001" in content
-    assert "Missing success metrics" in content
+    content = output_file.read_bytes()
+    assert b"REQ-001" in content
+    assert b"Missing success metrics" in content
 
 
-def test_explain_no_color() -> None:
+def test_explain_no_color(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test explain with --no-color flag."""
-    result = runner.invoke(app, ["explain", "REQ-001", "--no-color"])
+    result = runner.invoke(cli_app, ["explain", "REQ-001", "--no-color"])
 
     assert result.exit_code == 0
     assert "REQ-001" in result.stdout
@@ -129,78 +132,81 @@ def test_explain_no_color() -> None:
     assert "\x1b[" not in result.stdout
 
 
-def test_explain_all_rules() -> None:
-    """Test that all 12 rules can be explained individually."""
-    rule_ids = [
-        "REQ-001",
-        "REQ-002",
-        "REQ-003",
-        "ARCH-001",
-        "ARCH-002",
-        "ARCH-003",
-        "TEST-001",
-        "OPS-001",
-        "OPS-002",
-        "SEC-001",
-        "PERF-001",
-        "DOC-001",
-    ]
+EXPECTED_RULE_TITLES = {
+    "REQ-001": "Missing success metrics",
+    "REQ-002": "Unclear scope or goals",
+    "REQ-003": "Missing non-functional requirements",
+    "ARCH-001": "Missing error handling strategy",
+    "ARCH-002": "Unclear dependencies",
+    "ARCH-003": "Missing data retention/privacy plan",
+    "TEST-001": "Missing test strategy",
+    "OPS-001": "Missing rollout/deployment plan",
+    "OPS-002": "Unclear ownership",
+    "SEC-001": "Missing security considerations",
+    "PERF-001": "Missing performance targets",
+    "DOC-001": "Missing decision rationale",
+}
+
+
+def test_explain_all_rules(runner: "CliRunner", cli_app: "typer.Typer") -> None:
+    """Test that all 12 rules are listed with the expected titles."""
+    result = runner.invoke(cli_app, ["explain", "--list", "--format", "json"])
+
+    assert result.exit_code == 0
+    parsed = json.loads(result.stdout_bytes)
+    by_id = {rule["id"]: rule["title"] for rule in parsed["rules"]}
+    assert by_id == EXPECTED_RULE_TITLES
+
+
+def test_explain_single_rule_text_smoke(runner: "CliRunner", cli_app: "typer.Typer") -> None:
+    """Smoke test the single-rule text path for a non-requirements rule."""
+    result = runner.invoke(cli_app, ["explain", "ARCH-003"])
+
+    assert result.exit_code == 0
+    assert "ARCH-003" in result.stdout
+    assert EXPECTED_RULE_TITLES["ARCH-003"] in result.stdout
+
 
-    expected_titles = {
-        "REQ-001": "Missing success metrics",
-        "REQ-002": "Unclear scope or goals",
-        "REQ-003": "Missing non-functional requirements",
-        "ARCH-001": "Missing error handling strategy",
-        "ARCH-002": "Unclear dependencies",
-        "ARCH-003": "Missing data retention/privacy plan",
-        "TEST-001": "Missing test strategy",
-        "OPS-001": "Missing rollout/deployment plan",
-        "OPS-002": "Unclear ownership",
-        "SEC-001": "Missing security considerations",
-        "PERF-001": "Missing performance targets",
-        "DOC-001": "Missing decision rationale",
-    }
-
-    for rule_id in rule_ids:
-        result = runner.invoke(app, ["explain", rule_id])
-        assert result.exit_code == 0, f"Failed to explain {rule_id}"
-        assert rule_id in result.stdout
-        assert expected_titles[rule_id] in result.stdout
-
-
-def test_explain_invalid_format() -> None:
+def test_explain_invalid_format(runner: "CliRunner", cli_app: "typer.Typer") -> None:
     """Test explain with invalid --format option."""
-    result = runner.invoke(app, ["explain", "REQ-001", "--format", "xml"])
+    result = runner.invoke(cli_app, ["explain", "REQ-001", "--format", "xml"])
 
     assert result.exit_code == 2
     assert "Error" in result.output or "error" in result.output.lower()
     assert "format" in result.output.lower()
 
 
-def test_explain_list_with_output_file(tmp_path: Path) -> None:
+def test_explain_list_with_output_file(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test writing list output to a file."""
     output_file = tmp_path / "rules_list.txt"
-    result = runner.invoke(app, ["explain", "--list", "--output", str(output_file)])
+    result = runner.invoke(cli_app, ["explain", "--list", "--output", str(output_file)])
 
     assert result.exit_code == 0
     assert output_file.exists()
 
-    content = output_file.read_text()
-    assert "REQ-001" in content
-    assert "ARCH-001" in content
+    content = output_file.read_bytes()
+    assert b"REQ-001" in content
+    assert b"ARCH-001" in content
 
 
-def test_explain_json_output_to_file(tmp_path: Path) -> None:
+def test_explain_json_output_to_file(
+    tmp_path: Path,
+    runner: "CliRunner",
+    cli_app: "typer.Typer",
+) -> None:
     """Test writing JSON explain output to a file."""
     output_file = tmp_path / "explanation.json"
     result = runner.invoke(
-        app, ["explain", "ARCH-001", "--format", "json", "--output", str(output_file)]
+        cli_app, ["explain", "ARCH-001", "--format", "json", "--output", str(output_file)]
     )
 
     assert result.exit_code == 0
     assert output_file.exists()
 
-    content = output_file.read_text()
-    parsed = json.loads(content)
+    parsed = json.loads(output_file.read_bytes())
     assert parsed["id"] == "ARCH-001"
     assert parsed["title"] == "Missing error handling strategy"
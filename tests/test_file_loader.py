@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from tiresias.core.file_loader import (
     discover_files,
     load_file_content,
@@ -9,51 +11,59 @@ from tiresias.core.file_loader import (
 )
 
 
-def test_discover_files_single_file(tmp_path: Path) -> None:
-    """Test discovering a single file."""
-    test_file = tmp_path / "test.md"
-    test_file.write_text("# Test")
-
-    files = discover_files(str(test_file))
-
-    assert len(files) == 1
-    assert files[0] == test_file
-
-
-def test_discover_files_directory(tmp_path: Path) -> None:
-    """Test discovering files in a directory."""
-    (tmp_path / "doc1.md").write_text("# Doc 1")
-    (tmp_path / "doc2.txt").write_text("Doc 2")
-    (tmp_path / "config.json").write_text("{}")
-    (tmp_path / "ignore.py").write_text("# Should be ignored")
-
-    files = discover_files(str(tmp_path))
-
-    assert len(files) == 3
-    assert all(f.suffix in {".md", ".txt", ".json"} for f in files)
-
-
-def test_discover_files_with_ignore_patterns(tmp_path: Path) -> None:
-    """Test file discovery with ignore patterns."""
-    (tmp_path / "include.md").write_text("# Include")
-    (tmp_path / "ignore.md").write_text("# Ignore")
-
-    files = discover_files(str(tmp_path), ignore_paths=["**/ignore.md"])
-
-    assert len(files) == 1
-    assert files[0].name == "include.md"
-
-
-def test_discover_files_returns_sorted(tmp_path: Path) -> None:
-    """Test that discovered files are sorted."""
-    (tmp_path / "z.md").write_text("Z")
-    (tmp_path / "a.md").write_text("A")
-    (tmp_path / "m.md").write_text("M")
+@pytest.mark.parametrize(
+    ("files", "target", "ignore", "expected_names"),
+    [
+        pytest.param(
+            [("test.md", "# Test")],
+            "test.md",
+            None,
+            ["test.md"],
+            id="single-file",
+        ),
+        pytest.param(
+            [
+                ("doc1.md", "# Doc 1"),
+                ("doc2.txt", "Doc 2"),
+                ("config.json", "{}"),
+                ("ignore.py", "# Should be ignored"),
+            ],
+            None,
+            None,
+            ["config.json", "doc1.md", "doc2.txt"],
+            id="directory",
+        ),
+        pytest.param(
+            [("include.md", "# Include"), ("ignore.md", "# Ignore")],
+            None,
+            ["**/ignore.md"],
+            ["include.md"],
+            id="ignore-patterns",
+        ),
+        pytest.param(
+            [("z.md", "Z"), ("a.md", "A"), ("m.md", "M")],
+            None,
+            None,
+            ["a.md", "m.md", "z.md"],
+            id="returns-sorted",
+        ),
+    ],
+)
+def test_discover_files(
+    tmp_path: Path,
+    files: list[tuple[str, str]],
+    target: str | None,
+    ignore: list[str] | None,
+    expected_names: list[str],
+) -> None:
+    """Test file discovery across single-file, directory, ignore, and sort cases."""
+    for name, body in files:
+        (tmp_path / name).write_text(body)
 
-    files = discover_files(str(tmp_path))
+    path = tmp_path / target if target else tmp_path
+    found = discover_files(str(path), ignore_paths=ignore)
 
-    names = [f.name for f in files]
-    assert names == sorted(names)
+    assert [f.name for f in found] == expected_names
 
 
 def test_load_file_content_basic(tmp_path: Path) -> None:
@@ -67,11 +77,10 @@ def test_load_file_content_basic(tmp_path: Path) -> None:
     assert loaded == content
 
 
-def test_load_file_content_truncates_large_files(tmp_path: Path) -> None:
+def test_load_file_content_truncates_large_files(tmp_path: Path, large_blob: bytes) -> None:
     """Test that large files are truncated."""
     test_file = tmp_path / "large.txt"
-    content = "x" * 300000  # 300k chars
-    test_file.write_text(content)
+    test_file.write_bytes(large_blob)  # 300k chars
 
     loaded = load_file_content(test_file, max_chars=1000)
 
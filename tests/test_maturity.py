@@ -9,6 +9,7 @@ from tiresias.core.maturity import (
     _generate_signals,
     _get_interpretation,
     compute_maturity,
+    compute_maturity_batch,
 )
 
 
@@ -218,7 +219,7 @@ def test_maturity_score_calculation() -> None:
         char_count=3000,  # 20 points (2000-5000 range)
         section_count=7,  # 20 points (6-10 range)
         core_sections_present=5,  # ~28 points (5/9 * 50)
-        core_sections_found=["goals_scope", "testing", "security", "dependencies", "rollout"],
+        core_sections_found=("goals_scope", "testing", "security", "dependencies", "rollout"),
     )
 
     score = _calculate_score(metrics)
@@ -231,7 +232,7 @@ def test_maturity_score_calculation_edge_cases() -> None:
     """Test score calculation edge cases."""
     # Empty document
     empty_metrics = MaturityMetrics(
-        char_count=0, section_count=0, core_sections_present=0, core_sections_found=[]
+        char_count=0, section_count=0, core_sections_present=0, core_sections_found=()
     )
     assert _calculate_score(empty_metrics) == 0
 
@@ -240,7 +241,7 @@ def test_maturity_score_calculation_edge_cases() -> None:
         char_count=10000,
         section_count=15,
         core_sections_present=9,
-        core_sections_found=["all"] * 9,
+        core_sections_found=("all",) * 9,
     )
     score = _calculate_score(max_metrics)
     assert score == 100  # Capped at 100
@@ -292,9 +293,9 @@ def test_maturity_signal_generation() -> None:
     """Test signal generation for various scenarios."""
     # Very short document with no core sections
     metrics1 = MaturityMetrics(
-        char_count=100, section_count=1, core_sections_present=0, core_sections_found=[]
+        char_count=100, section_count=1, core_sections_present=0, core_sections_found=()
     )
-    signals1 = _generate_signals(metrics1, [])
+    signals1 = _generate_signals(metrics1, ())
     assert "very_short_length" in signals1
     assert "missing_most_core_sections" in signals1
     assert "missing_goals" in signals1
@@ -306,7 +307,7 @@ def test_maturity_signal_generation() -> None:
         char_count=6000,
         section_count=12,
         core_sections_present=8,
-        core_sections_found=[
+        core_sections_found=(
             "goals_scope",
             "success_metrics",
             "testing",
@@ -315,11 +316,11 @@ def test_maturity_signal_generation() -> None:
             "rollout",
             "nonfunctional_reqs",
             "error_handling",
-        ],
+        ),
     )
     signals2 = _generate_signals(
         metrics2,
-        [
+        (
             "goals_scope",
             "success_metrics",
             "testing",
@@ -328,7 +329,7 @@ def test_maturity_signal_generation() -> None:
             "rollout",
             "nonfunctional_reqs",
             "error_handling",
-        ],
+        ),
     )
     assert "comprehensive_length" in signals2
     assert "many_sections" in signals2
@@ -435,7 +436,7 @@ def test_maturity_threshold_boundary() -> None:
         char_count=500,  # 10 points
         section_count=3,  # 10 points
         core_sections_present=1,  # ~5 points
-        core_sections_found=["goals_scope"],
+        core_sections_found=("goals_scope",),
     )
     score_25 = _calculate_score(metrics_25)
     level_25 = _determine_level(score_25)
@@ -446,8 +447,25 @@ def test_maturity_threshold_boundary() -> None:
         char_count=2000,  # 20 points
         section_count=6,  # 20 points
         core_sections_present=2,  # ~11 points
-        core_sections_found=["goals_scope", "testing"],
+        core_sections_found=("goals_scope", "testing"),
     )
     score_50 = _calculate_score(metrics_50)
     level_50 = _determine_level(score_50)
     assert level_50 == "design_spec"
+
+
+def test_compute_maturity_batch_preserves_order() -> None:
+    """Test that batch computation matches per-document results in input order."""
+    docs = [
+        ("", []),
+        ("# Goals\nShort note about project goals.", ["goals"]),
+    ]
+
+    results = compute_maturity_batch(docs)
+
+    assert results == [compute_maturity(content, sections) for content, sections in docs]
+
+
+def test_compute_maturity_batch_empty() -> None:
+    """Test batch computation with no documents."""
+    assert compute_maturity_batch([]) == []
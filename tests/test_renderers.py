@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from tiresias import __version__
 from tiresias.renderers.json import render_json
 from tiresias.renderers.text import render_text
@@ -16,8 +18,9 @@ from tiresias.schemas.report import (
 )
 
 
-def _create_test_maturity() -> Maturity:
-    """Create a default maturity object for tests."""
+@pytest.fixture(scope="module")
+def test_maturity() -> Maturity:
+    """Default maturity object shared across renderer tests."""
     return Maturity(
         level="early_draft",
         score=30,
@@ -28,14 +31,15 @@ def _create_test_maturity() -> Maturity:
             char_count=100,
             section_count=2,
             core_sections_present=1,
-            core_sections_found=["goals_scope"],
+            core_sections_found=("goals_scope",),
         ),
     )
 
 
-def test_render_json_valid() -> None:
-    """Test that JSON renderer produces valid JSON."""
-    report = ReviewReport(
+@pytest.fixture(scope="module")
+def base_report(test_maturity: Maturity) -> ReviewReport:
+    """Minimal validated report; tests override fields via model_copy."""
+    return ReviewReport(
         metadata=Metadata(
             tool_version=__version__,
             timestamp="2024-01-01T00:00:00Z",
@@ -43,7 +47,7 @@ def test_render_json_valid() -> None:
             profile="general",
             elapsed_ms=100,
         ),
-        maturity=_create_test_maturity(),
+        maturity=test_maturity,
         findings=[],
         assumptions=[],
         open_questions=[],
@@ -52,7 +56,10 @@ def test_render_json_valid() -> None:
         risk_score_explanation="Risk score: 0/100 (Low)",
     )
 
-    output = render_json(report)
+
+def test_render_json_valid(base_report: ReviewReport) -> None:
+    """Test that JSON renderer produces valid JSON."""
+    output = render_json(base_report)
 
     # Should be valid JSON
     parsed = json.loads(output)
@@ -62,33 +69,27 @@ def test_render_json_valid() -> None:
     assert parsed["risk_score"] == 0
 
 
-def test_render_json_deterministic() -> None:
+def test_render_json_deterministic(base_report: ReviewReport) -> None:
     """Test that JSON output is deterministic."""
-    report = ReviewReport(
-        metadata=Metadata(
-            tool_version=__version__,
-            timestamp="2024-01-01T00:00:00Z",
-            input_files=["test.md"],
-            profile="general",
-            elapsed_ms=100,
-        ),
-        maturity=_create_test_maturity(),
-        findings=[
-            Finding(
-                id="TEST-001",
-                title="Test Finding",
-                severity=Severity.HIGH,
-                category=Category.REQUIREMENTS,
-                evidence="Evidence",
-                impact="Impact",
-                recommendation="Recommendation",
-            ),
-        ],
-        assumptions=["Assumption 1"],
-        open_questions=["Question 1"],
-        quick_summary=["Summary"],
-        risk_score=15,
-        risk_score_explanation="15/100",
+    report = base_report.model_copy(
+        update={
+            "findings": [
+                Finding(
+                    id="TEST-001",
+                    title="Test Finding",
+                    severity=Severity.HIGH,
+                    category=Category.REQUIREMENTS,
+                    evidence="Evidence",
+                    impact="Impact",
+                    recommendation="Recommendation",
+                ),
+            ],
+            "assumptions": ["Assumption 1"],
+            "open_questions": ["Question 1"],
+            "quick_summary": ["Summary"],
+            "risk_score": 15,
+            "risk_score_explanation": "15/100",
+        }
     )
 
     output1 = render_json(report)
@@ -98,42 +99,34 @@ def test_render_json_deterministic() -> None:
     assert output1 == output2
 
 
-def test_render_json_includes_findings() -> None:
+def test_render_json_includes_findings(base_report: ReviewReport) -> None:
     """Test that JSON includes all findings."""
-    report = ReviewReport(
-        metadata=Metadata(
-            tool_version=__version__,
-            timestamp="2024-01-01T00:00:00Z",
-            input_files=["test.md"],
-            profile="general",
-            elapsed_ms=100,
-        ),
-        maturity=_create_test_maturity(),
-        findings=[
-            Finding(
-                id="TEST-001",
-                title="First Finding",
-                severity=Severity.HIGH,
-                category=Category.REQUIREMENTS,
-                evidence="Evidence 1",
-                impact="Impact 1",
-                recommendation="Recommendation 1",
-            ),
-            Finding(
-                id="TEST-002",
-                title="Second Finding",
-                severity=Severity.MEDIUM,
-                category=Category.TESTING,
-                evidence="Evidence 2",
-                impact="Impact 2",
-                recommendation="Recommendation 2",
-            ),
-        ],
-        assumptions=[],
-        open_questions=[],
-        quick_summary=["2 findings"],
-        risk_score=23,
-        risk_score_explanation="23/100",
+    report = base_report.model_copy(
+        update={
+            "findings": [
+                Finding(
+                    id="TEST-001",
+                    title="First Finding",
+                    severity=Severity.HIGH,
+                    category=Category.REQUIREMENTS,
+                    evidence="Evidence 1",
+                    impact="Impact 1",
+                    recommendation="Recommendation 1",
+                ),
+                Finding(
+                    id="TEST-002",
+                    title="Second Finding",
+                    severity=Severity.MEDIUM,
+                    category=Category.TESTING,
+                    evidence="Evidence 2",
+                    impact="Impact 2",
+                    recommendation="Recommendation 2",
+                ),
+            ],
+            "quick_summary": ["2 findings"],
+            "risk_score": 23,
+            "risk_score_explanation": "23/100",
+        }
     )
 
     output = render_json(report)
@@ -144,33 +137,27 @@ def test_render_json_includes_findings() -> None:
     assert parsed["findings"][1]["id"] == "TEST-002"
 
 
-def test_render_text_includes_sections() -> None:
+def test_render_text_includes_sections(base_report: ReviewReport) -> None:
     """Test that text renderer includes expected sections."""
-    report = ReviewReport(
-        metadata=Metadata(
-            tool_version=__version__,
-            timestamp="2024-01-01T00:00:00Z",
-            input_files=["test.md"],
-            profile="general",
-            elapsed_ms=100,
-        ),
-        maturity=_create_test_maturity(),
-        findings=[
-            Finding(
-                id="HIGH-001",
-                title="High Severity Finding",
-                severity=Severity.HIGH,
-                category=Category.ARCHITECTURE,
-                evidence="Evidence",
-                impact="Impact",
-                recommendation="Fix this",
-            ),
-        ],
-        assumptions=["Test assumption"],
-        open_questions=["Test question?"],
-        quick_summary=["1 high finding"],
-        risk_score=15,
-        risk_score_explanation="Risk score: 15/100 (Low)",
+    report = base_report.model_copy(
+        update={
+            "findings": [
+                Finding(
+                    id="HIGH-001",
+                    title="High Severity Finding",
+                    severity=Severity.HIGH,
+                    category=Category.ARCHITECTURE,
+                    evidence="Evidence",
+                    impact="Impact",
+                    recommendation="Fix this",
+                ),
+            ],
+            "assumptions": ["Test assumption"],
+            "open_questions": ["Test question?"],
+            "quick_summary": ["1 high finding"],
+            "risk_score": 15,
+            "risk_score_explanation": "Risk score: 15/100 (Low)",
+        }
     )
 
     output = render_text(report, no_color=True)
@@ -186,23 +173,13 @@ def test_render_text_includes_sections() -> None:
     assert "Summary" in output
 
 
-def test_render_text_no_color() -> None:
+def test_render_text_no_color(base_report: ReviewReport) -> None:
     """Test that no_color flag works."""
-    report = ReviewReport(
-        metadata=Metadata(
-            tool_version=__version__,
-            timestamp="2024-01-01T00:00:00Z",
-            input_files=["test.md"],
-            profile="general",
-            elapsed_ms=100,
-        ),
-        maturity=_create_test_maturity(),
-        findings=[],
-        assumptions=[],
-        open_questions=[],
-        quick_summary=["Clean"],
-        risk_score=0,
-        risk_score_explanation="0/100 (Low)",
+    report = base_report.model_copy(
+        update={
+            "quick_summary": ["Clean"],
+            "risk_score_explanation": "0/100 (Low)",
+        }
     )
 
     output = render_text(report, no_color=True)
@@ -211,33 +188,25 @@ def test_render_text_no_color() -> None:
     assert "\x1b[" not in output
 
 
-def test_render_text_evidence_truncation_high_severity() -> None:
+def test_render_text_evidence_truncation_high_severity(base_report: ReviewReport) -> None:
     """Test that high severity shows full evidence."""
-    report = ReviewReport(
-        metadata=Metadata(
-            tool_version=__version__,
-            timestamp="2024-01-01T00:00:00Z",
-            input_files=["test.md"],
-            profile="general",
-            elapsed_ms=100,
-        ),
-        maturity=_create_test_maturity(),
-        findings=[
-            Finding(
-                id="HIGH-001",
-                title="High Finding",
-                severity=Severity.HIGH,
-                category=Category.ARCHITECTURE,
-                evidence="First sentence. Second sentence. Third sentence. Fourth sentence.",
-                impact="Impact",
-                recommendation="Fix",
-            ),
-        ],
-        assumptions=[],
-        open_questions=[],
-        quick_summary=["1 finding"],
-        risk_score=15,
-        risk_score_explanation="15/100",
+    report = base_report.model_copy(
+        update={
+            "findings": [
+                Finding(
+                    id="HIGH-001",
+                    title="High Finding",
+                    severity=Severity.HIGH,
+                    category=Category.ARCHITECTURE,
+                    evidence="First sentence. Second sentence. Third sentence. Fourth sentence.",
+                    impact="Impact",
+                    recommendation="Fix",
+                ),
+            ],
+            "quick_summary": ["1 finding"],
+            "risk_score": 15,
+            "risk_score_explanation": "15/100",
+        }
     )
 
     output = render_text(report, no_color=True, show_evidence=True)
@@ -248,33 +217,25 @@ def test_render_text_evidence_truncation_high_severity() -> None:
     assert "..." not in output or "Fourth sentence..." not in output  # No truncation on last
 
 
-def test_render_text_evidence_truncation_medium_severity() -> None:
+def test_render_text_evidence_truncation_medium_severity(base_report: ReviewReport) -> None:
     """Test that medium severity truncates to 2 sentences."""
-    report = ReviewReport(
-        metadata=Metadata(
-            tool_version=__version__,
-            timestamp="2024-01-01T00:00:00Z",
-            input_files=["test.md"],
-            profile="general",
-            elapsed_ms=100,
-        ),
-        maturity=_create_test_maturity(),
-        findings=[
-            Finding(
-                id="MED-001",
-                title="Medium Finding",
-                severity=Severity.MEDIUM,
-                category=Category.TESTING,
-                evidence="First sentence. Second sentence. Third sentence. Fourth sentence.",
-                impact="Impact",
-                recommendation="Fix",
-            ),
-        ],
-        assumptions=[],
-        open_questions=[],
-        quick_summary=["1 finding"],
-        risk_score=8,
-        risk_score_explanation="8/100",
+    report = base_report.model_copy(
+        update={
+            "findings": [
+                Finding(
+                    id="MED-001",
+                    title="Medium Finding",
+                    severity=Severity.MEDIUM,
+                    category=Category.TESTING,
+                    evidence="First sentence. Second sentence. Third sentence. Fourth sentence.",
+                    impact="Impact",
+                    recommendation="Fix",
+                ),
+            ],
+            "quick_summary": ["1 finding"],
+            "risk_score": 8,
+            "risk_score_explanation": "8/100",
+        }
     )
 
     output = render_text(report, no_color=True, show_evidence=True)
@@ -285,33 +246,25 @@ def test_render_text_evidence_truncation_medium_severity() -> None:
     assert "..." in output
 
 
-def test_render_text_evidence_truncation_low_severity() -> None:
+def test_render_text_evidence_truncation_low_severity(base_report: ReviewReport) -> None:
     """Test that low severity truncates to 1 sentence."""
-    report = ReviewReport(
-        metadata=Metadata(
-            tool_version=__version__,
-            timestamp="2024-01-01T00:00:00Z",
-            input_files=["test.md"],
-            profile="general",
-            elapsed_ms=100,
-        ),
-        maturity=_create_test_maturity(),
-        findings=[
-            Finding(
-                id="LOW-001",
-                title="Low Finding",
-                severity=Severity.LOW,
-                category=Category.DOCUMENTATION,
-                evidence="First sentence. Second sentence. Third sentence.",
-                impact="Impact",
-                recommendation="Fix",
-            ),
-        ],
-        assumptions=[],
-        open_questions=[],
-        quick_summary=["1 finding"],
-        risk_score=3,
-        risk_score_explanation="3/100",
+    report = base_report.model_copy(
+        update={
+            "findings": [
+                Finding(
+                    id="LOW-001",
+                    title="Low Finding",
+                    severity=Severity.LOW,
+                    category=Category.DOCUMENTATION,
+                    evidence="First sentence. Second sentence. Third sentence.",
+                    impact="Impact",
+                    recommendation="Fix",
+                ),
+            ],
+            "quick_summary": ["1 finding"],
+            "risk_score": 3,
+            "risk_score_explanation": "3/100",
+        }
     )
 
     output = render_text(report, no_color=True, show_evidence=True)
@@ -321,33 +274,25 @@ def test_render_text_evidence_truncation_low_severity() -> None:
     assert "..." in output
 
 
-def test_render_json_always_includes_evidence() -> None:
+def test_render_json_always_includes_evidence(base_report: ReviewReport) -> None:
     """Test that JSON always includes evidence regardless of flag."""
-    report = ReviewReport(
-        metadata=Metadata(
-            tool_version=__version__,
-            timestamp="2024-01-01T00:00:00Z",
-            input_files=["test.md"],
-            profile="general",
-            elapsed_ms=100,
-        ),
-        maturity=_create_test_maturity(),
-        findings=[
-            Finding(
-                id="TEST-001",
-                title="Test",
-                severity=Severity.HIGH,
-                category=Category.REQUIREMENTS,
-                evidence="Test evidence",
-                impact="Impact",
-                recommendation="Fix",
-            ),
-        ],
-        assumptions=[],
-        open_questions=[],
-        quick_summary=["1 finding"],
-        risk_score=15,
-        risk_score_explanation="15/100",
+    report = base_report.model_copy(
+        update={
+            "findings": [
+                Finding(
+                    id="TEST-001",
+                    title="Test",
+                    severity=Severity.HIGH,
+                    category=Category.REQUIREMENTS,
+                    evidence="Test evidence",
+                    impact="Impact",
+                    recommendation="Fix",
+                ),
+            ],
+            "quick_summary": ["1 finding"],
+            "risk_score": 15,
+            "risk_score_explanation": "15/100",
+        }
     )
 
     output = render_json(report)
@@ -357,35 +302,27 @@ def test_render_json_always_includes_evidence() -> None:
     assert parsed["findings"][0]["evidence"] == "Test evidence"
 
 
-def test_render_text_includes_maturity() -> None:
+def test_render_text_includes_maturity(base_report: ReviewReport) -> None:
     """Test that text renderer displays maturity."""
-    report = ReviewReport(
-        metadata=Metadata(
-            tool_version=__version__,
-            timestamp="2024-01-01T00:00:00Z",
-            input_files=["test.md"],
-            profile="general",
-            elapsed_ms=100,
-        ),
-        maturity=Maturity(
-            level="early_draft",
-            score=35,
-            confidence="medium",
-            interpretation="Incomplete sections are expected.",
-            signals=["short_length", "few_sections"],
-            metrics=MaturityMetrics(
-                char_count=800,
-                section_count=3,
-                core_sections_present=2,
-                core_sections_found=["goals_scope", "dependencies"],
+    report = base_report.model_copy(
+        update={
+            "maturity": Maturity(
+                level="early_draft",
+                score=35,
+                confidence="medium",
+                interpretation="Incomplete sections are expected.",
+                signals=["short_length", "few_sections"],
+                metrics=MaturityMetrics(
+                    char_count=800,
+                    section_count=3,
+                    core_sections_present=2,
+                    core_sections_found=("goals_scope", "dependencies"),
+                ),
             ),
-        ),
-        findings=[],
-        assumptions=[],
-        open_questions=[],
-        quick_summary=["1 finding"],
-        risk_score=15,
-        risk_score_explanation="15/100",
+            "quick_summary": ["1 finding"],
+            "risk_score": 15,
+            "risk_score_explanation": "15/100",
+        }
     )
 
     output = render_text(report, no_color=True)
@@ -396,41 +333,33 @@ def test_render_text_includes_maturity() -> None:
     assert "Incomplete sections are expected" in output
 
 
-def test_render_json_includes_maturity() -> None:
+def test_render_json_includes_maturity(base_report: ReviewReport) -> None:
     """Test that JSON includes maturity field."""
-    report = ReviewReport(
-        metadata=Metadata(
-            tool_version=__version__,
-            timestamp="2024-01-01T00:00:00Z",
-            input_files=["test.md"],
-            profile="general",
-            elapsed_ms=100,
-        ),
-        maturity=Maturity(
-            level="design_spec",
-            score=62,
-            confidence="high",
-            interpretation="Document is substantial.",
-            signals=["comprehensive_length", "many_sections"],
-            metrics=MaturityMetrics(
-                char_count=3000,
-                section_count=8,
-                core_sections_present=5,
-                core_sections_found=[
-                    "goals_scope",
-                    "testing",
-                    "security",
-                    "dependencies",
-                    "rollout",
-                ],
+    report = base_report.model_copy(
+        update={
+            "maturity": Maturity(
+                level="design_spec",
+                score=62,
+                confidence="high",
+                interpretation="Document is substantial.",
+                signals=["comprehensive_length", "many_sections"],
+                metrics=MaturityMetrics(
+                    char_count=3000,
+                    section_count=8,
+                    core_sections_present=5,
+                    core_sections_found=(
+                        "goals_scope",
+                        "testing",
+                        "security",
+                        "dependencies",
+                        "rollout",
+                    ),
+                ),
             ),
-        ),
-        findings=[],
-        assumptions=[],
-        open_questions=[],
-        quick_summary=["Clean"],
-        risk_score=20,
-        risk_score_explanation="20/100",
+            "quick_summary": ["Clean"],
+            "risk_score": 20,
+            "risk_score_explanation": "20/100",
+        }
     )
 
     output = render_json(report)
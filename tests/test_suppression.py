@@ -133,7 +133,7 @@ def test_apply_suppressions_profile_filter_match() -> None:
     ]
     config = TiresiasConfig(
         suppressions=[
-            SuppressionEntry(id="REQ-001", reason="Profile match", profiles=["general"]),
+            SuppressionEntry(id="REQ-001", reason="Profile match", profiles=("general",)),
         ]
     )
 
@@ -158,7 +158,7 @@ def test_apply_suppressions_profile_filter_no_match() -> None:
     ]
     config = TiresiasConfig(
         suppressions=[
-            SuppressionEntry(id="REQ-001", reason="Wrong profile", profiles=["security"]),
+            SuppressionEntry(id="REQ-001", reason="Wrong profile", profiles=("security",)),
         ]
     )
 
@@ -183,7 +183,7 @@ def test_apply_suppressions_severity_filter_match() -> None:
     ]
     config = TiresiasConfig(
         suppressions=[
-            SuppressionEntry(id="REQ-001", reason="Severity match", severities=["high"]),
+            SuppressionEntry(id="REQ-001", reason="Severity match", severities=("high",)),
         ]
     )
 
@@ -208,7 +208,7 @@ def test_apply_suppressions_severity_filter_no_match() -> None:
     ]
     config = TiresiasConfig(
         suppressions=[
-            SuppressionEntry(id="REQ-001", reason="Wrong severity", severities=["low"]),
+            SuppressionEntry(id="REQ-001", reason="Wrong severity", severities=("low",)),
         ]
     )
 
@@ -233,7 +233,7 @@ def test_apply_suppressions_scope_filter_match() -> None:
     ]
     config = TiresiasConfig(
         suppressions=[
-            SuppressionEntry(id="REQ-001", reason="Scope match", scope=["*.md"]),
+            SuppressionEntry(id="REQ-001", reason="Scope match", scope=("*.md",)),
         ]
     )
 
@@ -258,7 +258,7 @@ def test_apply_suppressions_scope_filter_no_match() -> None:
     ]
     config = TiresiasConfig(
         suppressions=[
-            SuppressionEntry(id="REQ-001", reason="Wrong scope", scope=["*.txt"]),
+            SuppressionEntry(id="REQ-001", reason="Wrong scope", scope=("*.txt",)),
         ]
     )
 
@@ -285,7 +285,7 @@ def test_apply_suppressions_scope_glob_patterns() -> None:
     # Test ** wildcard
     config = TiresiasConfig(
         suppressions=[
-            SuppressionEntry(id="REQ-001", reason="Deep match", scope=["docs/**/*.md"]),
+            SuppressionEntry(id="REQ-001", reason="Deep match", scope=("docs/**/*.md",)),
         ]
     )
     result = apply_suppressions(findings, config, "general", ["docs/design/spec.md"])
@@ -294,7 +294,7 @@ def test_apply_suppressions_scope_glob_patterns() -> None:
     # Test directory match
     config = TiresiasConfig(
         suppressions=[
-            SuppressionEntry(id="REQ-001", reason="Dir match", scope=["docs/*"]),
+            SuppressionEntry(id="REQ-001", reason="Dir match", scope=("docs/*",)),
         ]
     )
     result = apply_suppressions(findings, config, "general", ["docs/spec.md"])
@@ -547,9 +547,9 @@ def test_suppression_combined_filters() -> None:
             SuppressionEntry(
                 id="REQ-001",
                 reason="All match",
-                profiles=["general"],
-                severities=["high"],
-                scope=["*.md"],
+                profiles=("general",),
+                severities=("high",),
+                scope=("*.md",),
             ),
         ]
     )
@@ -562,9 +562,9 @@ def test_suppression_combined_filters() -> None:
             SuppressionEntry(
                 id="REQ-001",
                 reason="Profile mismatch",
-                profiles=["security"],
-                severities=["high"],
-                scope=["*.md"],
+                profiles=("security",),
+                severities=("high",),
+                scope=("*.md",),
             ),
         ]
     )